@@ -2,10 +2,98 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 from scipy.optimize import linear_sum_assignment
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
 from collections import deque
+import gc
+
+# Numba is optional: without it the JIT-decorated helpers run as plain Python
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# lap's Jonker-Volgenant solver is optional: scipy's solver is the fallback
+try:
+    from lap import lapjv
+except ImportError:
+    lapjv = None
+
+
+def _solve_assignment(cost_matrix):
+    """
+    Solve the linear sum assignment problem, returning (row_ind, col_ind)
+    like scipy.optimize.linear_sum_assignment.
+
+    Uses lap.lapjv when installed, which is faster than scipy on dense
+    matrices; otherwise falls back to scipy.
+    """
+    if lapjv is None:
+        return linear_sum_assignment(cost_matrix)
+
+    _, x, _ = lapjv(cost_matrix, extend_cost=True)
+    row_ind = np.flatnonzero(x >= 0)
+    return row_ind, x[row_ind].astype(np.intp)
+
+
+@njit(cache=True)
+def _find_min_cost_cycle(cost_matrix, exclude_i, exclude_j, col_of):
+    """
+    Helper function to find minimum cost alternating cycle.
+
+    Theory: To remove an assigned edge (exclude_i, exclude_j), we need to find
+    an alternating path that maintains assignment feasibility. The cost of
+    the minimum such cycle represents the sensitivity of this assignment.
+
+    Simplified Algorithm:
+    1. For each alternative assignment for worker exclude_i
+    2. Find the displaced worker from that alternative
+    3. Calculate cycle cost: new_cost - old_cost
+    4. Return minimum cycle cost
+
+    col_of maps each row to its assigned column (-1 if unassigned), so the
+    displaced worker's current job is a single array lookup.
+
+    Note: This is a simplified version. Full implementation would use
+    sophisticated graph algorithms like Hungarian method variants or
+    shortest augmenting path algorithms.
+    """
+    n = cost_matrix.shape[0]
+    min_cycle_cost = np.inf
+
+    # Find alternative assignments that create valid alternating cycles
+    for alt_j in range(n):
+        if alt_j != exclude_j:  # Try assigning exclude_i to alt_j
+            for alt_i in range(n):
+                if alt_i != exclude_i and col_of[alt_i] != -1:
+                    # Calculate cycle cost for this alternative
+                    # Cost = new assignments - old assignments
+                    current_alt_j = col_of[alt_i]
+                    cycle_cost = (cost_matrix[exclude_i, alt_j] +
+                                  cost_matrix[alt_i, exclude_j] -
+                                  cost_matrix[exclude_i, exclude_j] -
+                                  cost_matrix[alt_i, current_alt_j])
+                    min_cycle_cost = min(min_cycle_cost, abs(cycle_cost))
+
+    return min_cycle_cost if min_cycle_cost != np.inf else 5.0
+
+
+@njit(parallel=True, cache=True)
+def _assigned_cycle_costs(cost_matrix, row_ind, col_ind, col_of):
+    """
+    Minimum alternating cycle cost for every assigned edge.
+
+    Each edge's cycle search is independent of the others, so with Numba
+    the edges are spread across threads by prange.
+    """
+    cycle_costs = np.empty(row_ind.shape[0])
+    for k in prange(row_ind.shape[0]):
+        cycle_costs[k] = _find_min_cost_cycle(cost_matrix, row_ind[k], col_ind[k], col_of)
+    return cycle_costs
+
 
 class LSASensitivityAnalyzer:
     """
@@ -29,6 +117,35 @@ class LSASensitivityAnalyzer:
         self.original_assignment = None
         self.original_cost = None
         self.dual_variables = None
+
+        # Results widgets, built on first display
+        self._results_info = None
+        self._results_canvas = None
+
+        # Cached visualization figure and canvas (see _viz_axes_for)
+        self._viz_mode = None
+        self._viz_fig = None
+        self._viz_axes = None
+        self._viz_canvas = None
+        self._viz_drawn_cost = None  # cost matrix currently shown in the single view
+        self._method_axes = {}  # comparison view: method label -> (heatmap axes, colorbar axes)
+        self._method_hash = {}  # comparison view: method label -> key of the data last drawn
+        self._redraw_pending = False  # an analysis is already queued on the Tk loop
+        self._cmaps = {}  # colormap name -> resolved matplotlib colormap
+
+        # Method dispatch table: name -> (display label, method, shared inputs).
+        # Shared inputs name the precomputed keyword arguments each method
+        # accepts (see _shared_inputs), so they are solved once per analysis.
+        self._methods = {
+            'basic': ('Basic', self.calculate_basic_sensitivity, ('row_order', 'col_order')),
+            'dual_based': ('Dual-based', self.calculate_dual_based_sensitivity,
+                           ('row_ind', 'col_ind', 'u', 'v')),
+            'auction_based': ('Auction', self.auction_algorithm_sensitivity, ('prices',)),
+            'geometric_bounds': ('Geometric', self.geometric_bounds_sensitivity,
+                                 ('row_order', 'col_order')),
+            'reduced_cost': ('Reduced Cost', self.reduced_cost_sensitivity, ('row_ind', 'col_ind')),
+            'perturbation_theory': ('Perturbation', self.perturbation_theory_sensitivity, ()),
+        }
         
         self.setup_ui()
         
@@ -68,7 +185,7 @@ class LSASensitivityAnalyzer:
         
         # Buttons
         ttk.Button(control_frame, text="Create Matrix", command=self.create_matrix_input).grid(row=0, column=4, padx=5)
-        ttk.Button(control_frame, text="Analyze", command=self.analyze_sensitivity).grid(row=0, column=5, padx=5)
+        ttk.Button(control_frame, text="Analyze", command=self._schedule_redraw).grid(row=0, column=5, padx=5)
         ttk.Button(control_frame, text="Random", command=self.generate_random_matrix).grid(row=0, column=6, padx=5)
         
         # Input frame
@@ -85,24 +202,37 @@ class LSASensitivityAnalyzer:
         
         # Entry widgets storage
         self.entry_widgets = []
+        self.entry_vars = []  # StringVar backing each entry
         
     def create_matrix_input(self):
+        size = self.matrix_size.get()
+
+        # Same size as the current grid: reset values and reuse the widgets
+        if len(self.entry_vars) == size and all(len(row) == size for row in self.entry_vars):
+            for row_vars in self.entry_vars:
+                for var in row_vars:
+                    var.set("0")
+            return
+
         # Clear existing widgets
         for widget in self.input_frame.winfo_children():
             widget.destroy()
-        
-        size = self.matrix_size.get()
+
         self.entry_widgets = []
+        self.entry_vars = []
         
         # Create grid of entry widgets
         for i in range(size):
             row_entries = []
+            row_vars = []
             for j in range(size):
-                entry = ttk.Entry(self.input_frame, width=8, justify='center')
+                var = tk.StringVar(value="0")
+                entry = ttk.Entry(self.input_frame, width=8, justify='center', textvariable=var)
                 entry.grid(row=i, column=j, padx=2, pady=2)
-                entry.insert(0, "0")
                 row_entries.append(entry)
+                row_vars.append(var)
             self.entry_widgets.append(row_entries)
+            self.entry_vars.append(row_vars)
             
         # Add labels
         info_label = ttk.Label(self.input_frame, text="Enter cost matrix values:")
@@ -113,31 +243,37 @@ class LSASensitivityAnalyzer:
             self.create_matrix_input()
             
         size = self.matrix_size.get()
-        random_matrix = np.random.randint(1, 21, size=(size, size))
+        random_matrix = np.random.randint(1, 21, size=(size, size)).astype(str)
         
+        # One Tcl call per cell through the backing StringVar
         for i in range(size):
             for j in range(size):
-                self.entry_widgets[i][j].delete(0, tk.END)
-                self.entry_widgets[i][j].insert(0, str(random_matrix[i, j]))
+                self.entry_vars[i][j].set(random_matrix[i, j])
                 
     def get_matrix_from_input(self):
         if not self.entry_widgets:
             raise ValueError("No matrix input created")
             
         size = self.matrix_size.get()
-        matrix = np.zeros((size, size))
-        
-        for i in range(size):
-            for j in range(size):
+        strings = np.array([[var.get() for var in row[:size]] for row in self.entry_vars[:size]])
+
+        # Parse every cell in one NumPy call; only on failure fall back to
+        # a per-cell scan to report which entry is invalid
+        try:
+            matrix = strings.astype(np.float64)
+        except ValueError:
+            for (i, j), text in np.ndenumerate(strings):
                 try:
-                    value = float(self.entry_widgets[i][j].get())
-                    matrix[i, j] = value
+                    float(text)
                 except ValueError:
                     raise ValueError(f"Invalid value at position ({i}, {j})")
-                    
-        return matrix
+            raise
+
+        # Every sensitivity method (and the Numba kernels) relies on a
+        # C-contiguous float64 matrix, so fix the layout once at input
+        return np.ascontiguousarray(matrix, dtype=np.float64)
     
-    def calculate_basic_sensitivity(self, cost_matrix):
+    def calculate_basic_sensitivity(self, cost_matrix, row_order=None, col_order=None):
         """
         METHOD 1: Basic Row/Column Minimum Distance Approach
         
@@ -151,36 +287,48 @@ class LSASensitivityAnalyzer:
         2. Find the minimum in column j (excluding position i)
         3. Calculate distance from current value to these minimums
         4. Take the minimum of row and column sensitivities as limiting factor
-        
+
+        Vectorization: the two smallest values of every row and column are
+        found once with np.partition. The minimum excluding a cell is the
+        smallest value, unless the cell itself is that value, in which case
+        it is the second smallest. Precomputed argsorts of the rows and
+        columns (row_order, col_order) may be passed in to read the two
+        smallest values directly instead of partitioning.
+
         Strengths: Simple, intuitive, fast computation
         Weaknesses: Doesn't consider assignment structure, may be conservative
         """
         rows, cols = cost_matrix.shape
-        sensitivity = np.zeros_like(cost_matrix)
-        
-        for i in range(rows):
-            for j in range(cols):
-                current_value = cost_matrix[i, j]
-                
-                # Get row values excluding current position
-                row_values = np.delete(cost_matrix[i, :], j)
-                # Get column values excluding current position  
-                col_values = np.delete(cost_matrix[:, j], i)
-                
-                # Find minimums in row and column
-                row_min = np.min(row_values) if len(row_values) > 0 else current_value
-                col_min = np.min(col_values) if len(col_values) > 0 else current_value
-                
-                # Calculate sensitivity as distance from minimums
-                row_sensitivity = max(0, current_value - row_min)
-                col_sensitivity = max(0, current_value - col_min)
-                
-                # Take minimum as the limiting constraint
-                sensitivity[i, j] = min(row_sensitivity, col_sensitivity)
-                
+
+        # Single row/column: nothing to compare against, sensitivity is zero
+        if rows < 2 or cols < 2:
+            return np.zeros_like(cost_matrix)
+
+        # Two smallest values of each row (shape rows x 2) and column (2 x cols)
+        if row_order is None:
+            row_two = np.partition(cost_matrix, 1, axis=1)[:, :2]
+        else:
+            row_two = np.take_along_axis(cost_matrix, row_order[:, :2], axis=1)
+        if col_order is None:
+            col_two = np.partition(cost_matrix, 1, axis=0)[:2, :]
+        else:
+            col_two = np.take_along_axis(cost_matrix, col_order[:2, :], axis=0)
+
+        # Minimum excluding the current position
+        row_min = np.where(cost_matrix == row_two[:, [0]], row_two[:, [1]], row_two[:, [0]])
+        col_min = np.where(cost_matrix == col_two[[0], :], col_two[[1], :], col_two[[0], :])
+
+        # Distance from minimums, limited by the tighter of row and column.
+        # Every cell is written, so the output needs no zero-initialisation.
+        sensitivity = np.empty_like(cost_matrix)
+        row_sensitivity = np.subtract(cost_matrix, row_min, out=row_min)
+        col_sensitivity = np.subtract(cost_matrix, col_min, out=col_min)
+        np.minimum(row_sensitivity, col_sensitivity, out=sensitivity)
+        np.maximum(sensitivity, 0, out=sensitivity)
+
         return sensitivity
     
-    def calculate_dual_based_sensitivity(self, cost_matrix):
+    def calculate_dual_based_sensitivity(self, cost_matrix, row_ind=None, col_ind=None, u=None, v=None):
         """
         METHOD 2: Dual-Based Sensitivity Analysis
         
@@ -199,40 +347,63 @@ class LSASensitivityAnalyzer:
         3. Compute reduced costs: r[i,j] = c[i,j] - u[i] - v[j]
         4. Sensitivity = reduced cost (how much cost can decrease before optimality changes)
         
+        A precomputed assignment (row_ind, col_ind) and dual variables (u, v)
+        may be passed in to skip steps 1 and 2.
+
         Strengths: Theoretically sound, captures economic interpretation
         Weaknesses: May not capture all sensitivity aspects for discrete problems
         """
-        rows, cols = cost_matrix.shape
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
-        
-        # Initialize dual variables (shadow prices)
-        u = np.zeros(rows)  # Row dual variables (worker shadow prices)
-        v = np.zeros(cols)  # Column dual variables (job shadow prices)
-        
-        # Calculate dual variables using complementary slackness
-        # For assigned pairs: u[i] + v[j] = c[i,j]
-        for i, j in zip(row_ind, col_ind):
-            if i == 0:  # Normalize by setting first row dual to 0
-                u[i] = 0
-                v[j] = cost_matrix[i, j]
-            else:
-                # Use previously calculated v[j] to find u[i]
-                u[i] = cost_matrix[i, j] - v[j]
-        
-        # Calculate reduced costs and sensitivity
-        sensitivity = np.zeros_like(cost_matrix)
-        for i in range(rows):
-            for j in range(cols):
-                # Reduced cost = original cost - dual values
-                reduced_cost = cost_matrix[i, j] - u[i] - v[j]
-                # Sensitivity is how much we can decrease cost before reduced cost becomes negative
-                sensitivity[i, j] = max(0, reduced_cost)
-                
+        if u is None or v is None:
+            if row_ind is None or col_ind is None:
+                row_ind, col_ind = _solve_assignment(cost_matrix)
+
+            # Calculate dual variables (shadow prices) satisfying complementary
+            # slackness: u[i] + v[j] = c[i,j] for assigned pairs
+            u, v = self._recover_duals(cost_matrix, row_ind, col_ind)
+
+        # Reduced cost = original cost - dual values
+        reduced_cost = cost_matrix - u[:, None] - v[None, :]
+        # Sensitivity is how much we can decrease cost before reduced cost becomes negative
+        sensitivity = np.maximum(0, reduced_cost)
+
         # Store dual variables for analysis
         self.dual_variables = (u, v)
         return sensitivity
+
+    @staticmethod
+    def _recover_duals(cost_matrix, row_ind, col_ind):
+        """
+        Helper to recover optimal dual variables from an optimal assignment.
+
+        Complementary slackness fixes u[i] = c[i,σ(i)] - v[σ(i)] for each
+        assigned row i. Substituting into dual feasibility u[i] + v[j] ≤ c[i,j]
+        gives difference constraints between column duals:
+
+            v[j] - v[σ(i)] ≤ c[i,j] - c[i,σ(i)]
+
+        These are solved as shortest paths (vectorized Bellman-Ford) over a
+        graph with an edge σ(i) → j for every cell. An optimal assignment has
+        no negative cycles, so the iteration converges within n rounds.
+        """
+        rows, cols = cost_matrix.shape
+
+        # Edge weights between columns: σ(i) → j costs c[i,j] - c[i,σ(i)]
+        weights = np.full((cols, cols), np.inf)
+        weights[col_ind, :] = cost_matrix[row_ind, :] - cost_matrix[row_ind, col_ind][:, None]
+
+        # Shortest distances from a virtual source joined to every column at 0
+        v = np.zeros(cols)
+        for _ in range(cols):
+            relaxed = np.minimum(v, (v[:, None] + weights).min(axis=0))
+            if np.array_equal(relaxed, v):
+                break
+            v = relaxed
+
+        # Tightest row duals; the minimum is attained at the assigned column
+        u = (cost_matrix - v[None, :]).min(axis=1)
+        return u, v
     
-    def auction_algorithm_sensitivity(self, cost_matrix, eps=1.0):
+    def auction_algorithm_sensitivity(self, cost_matrix, eps=1.0, prices=None):
         """
         METHOD 3: Auction Algorithm-Based Sensitivity
         
@@ -254,64 +425,71 @@ class LSASensitivityAnalyzer:
         
         Algorithm Steps:
         1. Initialize prices and assignments
-        2. For each unassigned person, find best and second-best objects
-        3. Calculate bid increment based on competitive gap
-        4. Update prices and assignments
+        2. All unassigned persons find their best and second-best objects
+           at once (Jacobi-style parallel auction, Bertsekas & Castañon)
+        3. Calculate bid increments based on competitive gap
+        4. Each contested object goes to its highest bidder; update prices
+           and assignments
         5. Record bid increments as sensitivity measures
-        
+
+        Initial prices may be passed in to warm-start the auction, e.g. the
+        negated column duals (-v) of an already solved assignment.
+
         Strengths: Natural economic interpretation, captures competitive dynamics
         Weaknesses: May depend on ε parameter, iterative nature can be slow
         """
         n = cost_matrix.shape[0]
-        prices = np.zeros(n)  # Current prices for objects
-        assignment = [-1] * n  # person -> object assignment
-        reverse_assignment = [-1] * n  # object -> person assignment
-        
+        # Current prices for objects
+        prices = np.zeros(n) if prices is None else np.array(prices, dtype=float)
+        assignment = np.full(n, -1, dtype=np.int64)  # person -> object assignment
+        reverse_assignment = np.full(n, -1, dtype=np.int64)  # object -> person assignment
+
         # Run auction algorithm with sensitivity tracking
         max_iterations = n * n  # Prevent infinite loops
         sensitivity = np.zeros_like(cost_matrix)
-        
+
         for iteration in range(max_iterations):
             # Find unassigned persons
-            unassigned = [i for i in range(n) if assignment[i] == -1]
-            if not unassigned:
+            unassigned = np.flatnonzero(assignment == -1)
+            if unassigned.size == 0:
                 break  # All persons assigned
-                
-            person = unassigned[0]  # Take first unassigned person
-            
-            # Calculate benefits for this person (negative cost - price)
-            benefits = -(cost_matrix[person, :] + prices)  # Note: we want to minimize cost
-            best_obj = np.argmax(benefits)  # Best object (highest benefit)
-            
+            bidders = np.arange(unassigned.size)
+
+            # Calculate benefits for every bidder (negative cost - price)
+            benefits = -(cost_matrix[unassigned, :] + prices)  # Note: we want to minimize cost
+            best_obj = np.argmax(benefits, axis=1)  # Best object (highest benefit)
+            best_benefit = benefits[bidders, best_obj]
+
             # Find second-best benefit for competitive bidding
             if n > 1:
-                second_best_benefit = np.partition(benefits, -2)[-2]  # Second highest
+                second_best_benefit = np.partition(benefits, -2, axis=1)[:, -2]  # Second highest
             else:
-                second_best_benefit = benefits[0]
-            
-            best_benefit = benefits[best_obj]
-            
-            # Calculate bid increment (key for sensitivity analysis)
+                second_best_benefit = best_benefit
+
+            # Calculate bid increments (key for sensitivity analysis)
             # This represents how much the assignment can tolerate cost changes
             bid_increment = best_benefit - second_best_benefit + eps
-            
-            # Update sensitivity matrix with bid increment
-            sensitivity[person, best_obj] = bid_increment
-            
-            # Update auction state
-            if reverse_assignment[best_obj] != -1:
-                # Remove previous assignment (outbid previous person)
-                old_person = reverse_assignment[best_obj]
-                assignment[old_person] = -1
-                
-            # Make new assignment
-            assignment[person] = best_obj
-            reverse_assignment[best_obj] = person
-            prices[best_obj] += bid_increment  # Increase price due to bidding
-            
+
+            # Update sensitivity matrix with bid increments
+            sensitivity[unassigned, best_obj] = bid_increment
+
+            # Resolve collisions: each object goes to its highest bidder
+            order = np.lexsort((-bid_increment, best_obj))
+            won_objects, first = np.unique(best_obj[order], return_index=True)
+            winners = order[first]
+
+            # Remove previous assignments (outbid previous persons)
+            old_persons = reverse_assignment[won_objects]
+            assignment[old_persons[old_persons != -1]] = -1
+
+            # Make new assignments
+            assignment[unassigned[winners]] = won_objects
+            reverse_assignment[won_objects] = unassigned[winners]
+            prices[won_objects] += bid_increment[winners]  # Increase price due to bidding
+
         return sensitivity
     
-    def geometric_bounds_sensitivity(self, cost_matrix):
+    def geometric_bounds_sensitivity(self, cost_matrix, row_order=None, col_order=None):
         """
         METHOD 4: Geometric Bounds Using Assignment Polytope
         
@@ -342,47 +520,57 @@ class LSASensitivityAnalyzer:
         3. Find current element's rank position
         4. Calculate gap to next-ranked element
         5. Take minimum gap as geometric sensitivity bound
+
+        Precomputed argsorts of the rows and columns (row_order, col_order)
+        may be passed in to skip sorting.
         
         Strengths: Geometric intuition, considers local competition structure
         Weaknesses: Simplified model, may not capture global optimization effects
         """
-        rows, cols = cost_matrix.shape
-        sensitivity = np.zeros_like(cost_matrix)
-        
-        # For each cell, calculate geometric bounds based on competitive position
-        for i in range(rows):
-            for j in range(cols):
-                # Get competitors in the same row and column
-                row_competitors = cost_matrix[i, :]  # All elements in row i
-                col_competitors = cost_matrix[:, j]  # All elements in column j
-                
-                # Sort to establish competitive ranking
-                row_sorted = np.sort(row_competitors)
-                col_sorted = np.sort(col_competitors)
-                
-                # Find current element's rank position
-                current_value = cost_matrix[i, j]
-                row_rank = np.where(row_sorted == current_value)[0][0]
-                col_rank = np.where(col_sorted == current_value)[0][0]
-                
-                # Calculate geometric gaps to next competitive level
-                if row_rank < len(row_sorted) - 1:
-                    row_gap = row_sorted[row_rank + 1] - current_value
-                else:
-                    row_gap = float('inf')  # Already highest in row
-                    
-                if col_rank < len(col_sorted) - 1:
-                    col_gap = col_sorted[col_rank + 1] - current_value
-                else:
-                    col_gap = float('inf')  # Already highest in column
-                
-                # Sensitivity is the minimum gap (limiting constraint)
-                min_gap = min(row_gap, col_gap)
-                sensitivity[i, j] = min_gap if min_gap != float('inf') else 10.0
-                
+        # Gaps to the next competitive level along rows and along columns
+        row_gap = self._next_rank_gaps(cost_matrix, row_order)
+        col_gap = self._next_rank_gaps(cost_matrix.T, None if col_order is None else col_order.T).T
+
+        # Sensitivity is the minimum gap (limiting constraint)
+        sensitivity = np.empty_like(cost_matrix)
+        np.minimum(row_gap, col_gap, out=sensitivity)
+        sensitivity[np.isinf(sensitivity)] = 10.0
+
         return sensitivity
-    
-    def reduced_cost_sensitivity(self, cost_matrix):
+
+    @staticmethod
+    def _next_rank_gaps(matrix, order=None):
+        """
+        Helper for geometric bounds: gap from each element to the next-ranked
+        element in its row.
+
+        Each row is sorted once. An element's rank is the position of the first
+        occurrence of its value in the sorted row, so tied values share a rank
+        and get a gap of zero. Elements already ranked last get an infinite gap.
+        A precomputed row-wise argsort may be passed as order.
+        """
+        n = matrix.shape[1]
+        positions = np.arange(n)
+
+        # Sort each row once
+        if order is None:
+            order = np.argsort(matrix, axis=1, kind='stable')
+        row_sorted = np.take_along_axis(matrix, order, axis=1)
+
+        # Rank of each sorted position = start of its run of equal values
+        run_start = np.ones(row_sorted.shape, dtype=bool)
+        run_start[:, 1:] = row_sorted[:, 1:] != row_sorted[:, :-1]
+        sorted_rank = np.maximum.accumulate(np.where(run_start, positions, 0), axis=1)
+
+        # Scatter ranks back to the original element positions
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, sorted_rank, axis=1)
+
+        # Gap to the next competitive level
+        next_value = np.take_along_axis(row_sorted, np.minimum(rank + 1, n - 1), axis=1)
+        return np.where(rank < n - 1, next_value - matrix, np.inf)
+
+    def reduced_cost_sensitivity(self, cost_matrix, row_ind=None, col_ind=None):
         """
         METHOD 5: Advanced Reduced Cost Analysis with Network Flow Theory
         
@@ -414,14 +602,15 @@ class LSASensitivityAnalyzer:
         4. For each assigned edge: find min-cost alternating cycle
         5. Cycle cost represents sensitivity to removing that assignment
         
+        A precomputed optimal assignment (row_ind, col_ind) may be passed in
+        to skip step 1.
+
         Strengths: Theoretically rigorous, captures network structure
         Weaknesses: Complex cycle-finding, computationally intensive
         """
         rows, cols = cost_matrix.shape
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
-        
-        # Initialize sensitivity matrix
-        sensitivity = np.zeros_like(cost_matrix)
+        if row_ind is None or col_ind is None:
+            row_ind, col_ind = _solve_assignment(cost_matrix)
         
         # Calculate node potentials (dual variables) using network flow theory
         potentials_u = np.zeros(rows)  # Worker potentials
@@ -429,63 +618,27 @@ class LSASensitivityAnalyzer:
         
         # Set potentials based on optimal solution structure
         # Use the fact that for assigned edges: potential_u[i] + potential_v[j] = cost[i,j]
-        for i, j in zip(row_ind, col_ind):
-            potentials_v[j] = cost_matrix[i, j] - potentials_u[i]
-        
-        # Calculate reduced costs and sensitivities
-        for i in range(rows):
-            for j in range(cols):
-                # Reduced cost = original cost - sum of potentials
-                reduced_cost = cost_matrix[i, j] - potentials_u[i] - potentials_v[j]
-                
-                if (i, j) in zip(row_ind, col_ind):
-                    # For assigned edges: find minimum cost alternating cycle
-                    # This represents the cost of "breaking" this assignment
-                    sensitivity[i, j] = self._find_min_cost_cycle(cost_matrix, i, j, row_ind, col_ind)
-                else:
-                    # For unassigned edges: sensitivity is the reduced cost
-                    # This represents how much the cost must decrease to make this edge attractive
-                    sensitivity[i, j] = max(0, reduced_cost)
-                    
+        potentials_v[col_ind] = cost_matrix[row_ind, col_ind] - potentials_u[row_ind]
+
+        # Row -> assigned column lookup for the cycle search (-1 = unassigned)
+        col_of = np.full(rows, -1, dtype=np.int64)
+        col_of[row_ind] = col_ind
+
+        # Reduced cost = original cost - sum of potentials
+        reduced_cost = cost_matrix - potentials_u[:, None] - potentials_v[None, :]
+
+        # For unassigned edges: sensitivity is the reduced cost
+        # This represents how much the cost must decrease to make this edge attractive
+        assigned_mask = np.zeros(cost_matrix.shape, dtype=bool)
+        assigned_mask[row_ind, col_ind] = True
+        sensitivity = np.where(assigned_mask, 0.0, np.maximum(0, reduced_cost))
+
+        # For assigned edges: find minimum cost alternating cycle
+        # This represents the cost of "breaking" this assignment
+        sensitivity[row_ind, col_ind] = _assigned_cycle_costs(cost_matrix, row_ind, col_ind, col_of)
+
         return sensitivity
     
-    def _find_min_cost_cycle(self, cost_matrix, exclude_i, exclude_j, row_ind, col_ind):
-        """
-        Helper function to find minimum cost alternating cycle.
-        
-        Theory: To remove an assigned edge (exclude_i, exclude_j), we need to find
-        an alternating path that maintains assignment feasibility. The cost of
-        the minimum such cycle represents the sensitivity of this assignment.
-        
-        Simplified Algorithm:
-        1. For each alternative assignment for worker exclude_i
-        2. Find the displaced worker from that alternative
-        3. Calculate cycle cost: new_cost - old_cost
-        4. Return minimum cycle cost
-        
-        Note: This is a simplified version. Full implementation would use
-        sophisticated graph algorithms like Hungarian method variants or
-        shortest augmenting path algorithms.
-        """
-        n = cost_matrix.shape[0]
-        min_cycle_cost = float('inf')
-        
-        # Find alternative assignments that create valid alternating cycles
-        for alt_j in range(n):
-            if alt_j != exclude_j:  # Try assigning exclude_i to alt_j
-                for alt_i in range(n):
-                    if alt_i != exclude_i and alt_i in row_ind:
-                        # Calculate cycle cost for this alternative
-                        # Cost = new assignments - old assignments
-                        current_alt_j = col_ind[list(row_ind).index(alt_i)]
-                        cycle_cost = (cost_matrix[exclude_i, alt_j] + 
-                                    cost_matrix[alt_i, exclude_j] - 
-                                    cost_matrix[exclude_i, exclude_j] - 
-                                    cost_matrix[alt_i, current_alt_j])
-                        min_cycle_cost = min(min_cycle_cost, abs(cycle_cost))
-                        
-        return min_cycle_cost if min_cycle_cost != float('inf') else 5.0
-    
     def perturbation_theory_sensitivity(self, cost_matrix):
         """
         METHOD 6: Perturbation Theory Using Matrix Calculus
@@ -519,82 +672,81 @@ class LSASensitivityAnalyzer:
         5. Combine measures and scale by perturbation size
         6. Result indicates sensitivity to changes at that position
         
+        Closed Forms:
+        The perturbation C_perturbed - C = δ·eᵢeⱼᵀ is a rank-1 matrix with a
+        single non-zero entry, so its Frobenius and spectral norms are both δ
+        and the trace changes by δ only on the diagonal. Only the condition
+        number has to be evaluated per element. It uses first-order singular
+        value perturbation theory from a single SVD C = U·diag(σ)·Vᵀ:
+
+            σₖ(C + δ·eᵢeⱼᵀ) ≈ σₖ + δ·U[i,k]·V[j,k]
+
+        so all perturbed condition numbers come from one O(n³) decomposition.
+
         Strengths: Mathematically rigorous, captures higher-order effects
         Weaknesses: May not directly relate to assignment changes, computationally intensive
         """
         rows, cols = cost_matrix.shape
-        sensitivity = np.zeros_like(cost_matrix)
-        
+
         # Small perturbation for numerical differentiation
         delta = 0.01
-        
-        # Calculate matrix-norm-based sensitivity for each element
-        for i in range(rows):
-            for j in range(cols):
-                # Create perturbation matrix
-                pert_matrix = cost_matrix.copy()
-                pert_matrix[i, j] += delta
-                
-                # Calculate various matrix properties for sensitivity analysis
-                
-                # 1. Matrix trace changes (sum of diagonal elements)
-                original_trace = np.trace(cost_matrix)
-                perturbed_trace = np.trace(pert_matrix)
-                trace_sensitivity = abs(perturbed_trace - original_trace) / delta
-                
-                # 2. Frobenius norm change (overall matrix magnitude change)
-                frobenius_change = np.linalg.norm(pert_matrix - cost_matrix, 'fro')
-                frobenius_sensitivity = frobenius_change / delta
-                
-                # 3. Spectral norm change (maximum singular value change)
-                spectral_change = np.linalg.norm(pert_matrix - cost_matrix, 2)
-                spectral_sensitivity = spectral_change / delta
-                
-                # 4. Condition number sensitivity (numerical stability measure)
-                try:
-                    orig_cond = np.linalg.cond(cost_matrix)
-                    pert_cond = np.linalg.cond(pert_matrix)
-                    cond_sensitivity = abs(pert_cond - orig_cond) / delta
-                except:
-                    cond_sensitivity = 0
-                
-                # Combine multiple sensitivity measures for robust estimate
-                # Weight different measures based on their relevance to assignment problems
-                combined_sensitivity = (
-                    0.3 * frobenius_sensitivity +    # Overall change importance
-                    0.3 * spectral_sensitivity +     # Directional change importance  
-                    0.2 * trace_sensitivity +        # Diagonal structure importance
-                    0.2 * cond_sensitivity           # Numerical stability importance
-                ) * 100  # Scale for visualization
-                
-                sensitivity[i, j] = combined_sensitivity
-                
+
+        # 1. Matrix trace changes: δ on the diagonal, nothing elsewhere
+        trace_sensitivity = np.eye(rows, cols)
+
+        # 2. Frobenius norm change: ||δ·eᵢeⱼᵀ||_F / δ = 1 for every element
+        frobenius_sensitivity = 1.0
+
+        # 3. Spectral norm change: ||δ·eᵢeⱼᵀ||_2 / δ = 1 for every element
+        spectral_sensitivity = 1.0
+
+        # 4. Condition number sensitivity (numerical stability measure)
+        try:
+            U, S, Vt = np.linalg.svd(cost_matrix, full_matrices=False)
+
+            # First-order perturbed singular values, shape (rows, cols, k)
+            S_pert = np.abs(S + delta * U[:, None, :] * Vt.T[None, :, :])
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                orig_cond = S.max() / S.min()
+                pert_cond = S_pert.max(axis=2) / S_pert.min(axis=2)
+            cond_sensitivity = np.abs(pert_cond - orig_cond) / delta
+        except np.linalg.LinAlgError:
+            cond_sensitivity = np.zeros_like(cost_matrix)
+
+        # Combine multiple sensitivity measures for robust estimate
+        # Weight different measures based on their relevance to assignment problems
+        sensitivity = (
+            0.3 * frobenius_sensitivity +    # Overall change importance
+            0.3 * spectral_sensitivity +     # Directional change importance
+            0.2 * trace_sensitivity +        # Diagonal structure importance
+            0.2 * cond_sensitivity           # Numerical stability importance
+        ) * 100  # Scale for visualization
+
         return sensitivity
     
     def analyze_sensitivity(self):
         try:
             self.cost_matrix = self.get_matrix_from_input()
-            row_ind, col_ind = linear_sum_assignment(self.cost_matrix)
+            assert self.cost_matrix.dtype == np.float64 and self.cost_matrix.flags.c_contiguous
+            row_ind, col_ind = _solve_assignment(self.cost_matrix)
             self.original_assignment = (row_ind, col_ind)
             self.original_cost = self.cost_matrix[row_ind, col_ind].sum()
             
             method = self.sensitivity_method.get()
             
-            if method == 'basic':
-                self.sensitivity_matrix = self.calculate_basic_sensitivity(self.cost_matrix)
-            elif method == 'dual_based':
-                self.sensitivity_matrix = self.calculate_dual_based_sensitivity(self.cost_matrix)
-            elif method == 'auction_based':
-                self.sensitivity_matrix = self.auction_algorithm_sensitivity(self.cost_matrix)
-            elif method == 'geometric_bounds':
-                self.sensitivity_matrix = self.geometric_bounds_sensitivity(self.cost_matrix)
-            elif method == 'reduced_cost':
-                self.sensitivity_matrix = self.reduced_cost_sensitivity(self.cost_matrix)
-            elif method == 'perturbation_theory':
-                self.sensitivity_matrix = self.perturbation_theory_sensitivity(self.cost_matrix)
-            elif method == 'all_methods':
+            if method == 'all_methods':
                 self.compare_all_methods()
                 return
+            if method not in self._methods:
+                raise ValueError(f"Unknown sensitivity method: {method}")
+
+            _, method_fn, needs = self._methods[method]
+            shared = self._shared_inputs(needs)
+            # Stored as a contiguous float64 array so seaborn/imshow and the
+            # results grid can use it without another conversion
+            self.sensitivity_matrix = np.ascontiguousarray(method_fn(self.cost_matrix, **shared),
+                                                           dtype=np.float64)
             
             self.display_results()
             self.create_visualization()
@@ -602,6 +754,23 @@ class LSASensitivityAnalyzer:
         except Exception as e:
             messagebox.showerror("Error", str(e))
     
+    def _schedule_redraw(self):
+        """
+        Queue an analysis and replot on the Tk event loop.
+
+        Requests arriving within 50 ms of each other (e.g. repeated clicks on
+        Analyze) are coalesced into a single run, which keeps the event loop
+        responsive instead of blocking it once per click.
+        """
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after(50, self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.analyze_sensitivity()
+
     def compare_all_methods(self):
         """
         Compare all sensitivity methods side by side.
@@ -609,73 +778,143 @@ class LSASensitivityAnalyzer:
         This function runs all implemented sensitivity analysis methods
         on the same cost matrix to allow comparison of their different
         approaches and results.
+
+        The optimal assignment and its dual variables are solved once and
+        shared by the methods that need them, instead of each method
+        re-running the Hungarian algorithm.
         """
-        methods = {
-            'Basic': self.calculate_basic_sensitivity(self.cost_matrix),
-            'Dual-based': self.calculate_dual_based_sensitivity(self.cost_matrix),
-            'Auction': self.auction_algorithm_sensitivity(self.cost_matrix),
-            'Geometric': self.geometric_bounds_sensitivity(self.cost_matrix),
-            'Reduced Cost': self.reduced_cost_sensitivity(self.cost_matrix),
-            'Perturbation': self.perturbation_theory_sensitivity(self.cost_matrix)
-        }
+        all_needs = {name for _, _, needs in self._methods.values() for name in needs}
+        shared = self._shared_inputs(all_needs)
+
+        methods = {}
+        for label, method_fn, needs in self._methods.values():
+            kwargs = {name: shared[name] for name in needs}
+            methods[label] = np.ascontiguousarray(method_fn(self.cost_matrix, **kwargs), dtype=np.float64)
         
         self.create_comparison_visualization(methods)
+
+    def _shared_inputs(self, needs):
+        """
+        Build the precomputed keyword arguments named in needs.
+
+        The assignment comes from analyze_sensitivity; dual variables (and the
+        auction warm-start prices derived from them) and the row/column
+        argsorts are only computed when some method asks for them.
+        """
+        row_ind, col_ind = self.original_assignment
+        shared = {'row_ind': row_ind, 'col_ind': col_ind}
+
+        if {'u', 'v', 'prices'} & set(needs):
+            u, v = self._recover_duals(self.cost_matrix, row_ind, col_ind)
+            shared.update(u=u, v=v, prices=-v)
+
+        if {'row_order', 'col_order'} & set(needs):
+            shared['row_order'] = np.argsort(self.cost_matrix, axis=1, kind='stable')
+            shared['col_order'] = np.argsort(self.cost_matrix, axis=0, kind='stable')
+
+        return {name: shared[name] for name in needs}
         
     def display_results(self):
-        # Clear existing results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        # Build the results widgets once; later analyses update them in place
+        if self._results_canvas is None:
+            self._results_info = ttk.Label(self.results_frame, font=('Arial', 10))
+            self._results_info.grid(row=0, column=0, pady=(0, 10))
+
+            sens_label = ttk.Label(self.results_frame, text="Sensitivity Matrix:", font=('Arial', 10, 'bold'))
+            sens_label.grid(row=1, column=0, pady=(0, 5))
+
+            # Single canvas for the whole sensitivity grid instead of one Label per cell
+            self._results_canvas = tk.Canvas(self.results_frame, highlightthickness=0)
+            self._results_canvas.grid(row=2, column=0)
             
+        row_ind, col_ind = self.original_assignment
+
         # Original assignment info
         info_text = f"Original Assignment Cost: {self.original_cost:.2f}\n"
         info_text += f"Method: {self.sensitivity_method.get()}\n"
-        info_text += f"Assignment: {list(zip(self.original_assignment[0], self.original_assignment[1]))}"
-        
-        info_label = ttk.Label(self.results_frame, text=info_text, font=('Arial', 10))
-        info_label.grid(row=0, column=0, columnspan=len(self.sensitivity_matrix[0]), pady=(0, 10))
-        
-        # Sensitivity matrix display
-        sens_label = ttk.Label(self.results_frame, text="Sensitivity Matrix:", font=('Arial', 10, 'bold'))
-        sens_label.grid(row=1, column=0, columnspan=len(self.sensitivity_matrix[0]), pady=(0, 5))
-        
-        # Create grid for sensitivity values with color coding
-        for i, row in enumerate(self.sensitivity_matrix):
-            for j, value in enumerate(row):
-                # Highlight cells that are in the optimal assignment
-                if i in self.original_assignment[0] and j == self.original_assignment[1][list(self.original_assignment[0]).index(i)]:
-                    bg_color = 'lightgreen'  # Assigned cells
-                else:
-                    bg_color = 'white'  # Unassigned cells
-                    
-                label = tk.Label(self.results_frame, text=f"{value:.2f}", 
-                               relief='solid', borderwidth=1, width=8, height=2,
-                               bg=bg_color)
-                label.grid(row=i+2, column=j, padx=1, pady=1)
+        info_text += f"Assignment: {list(zip(row_ind.tolist(), col_ind.tolist()))}"
+        self._results_info.config(text=info_text)
+        
+        # Draw grid of sensitivity values with color coding
+        canvas = self._results_canvas
+        canvas.delete("all")
+        rows, cols = self.sensitivity_matrix.shape
+        cell_w, cell_h, gap = 64, 36, 2
+        canvas.config(width=cols * (cell_w + gap), height=rows * (cell_h + gap))
+
+        # Highlight cells that are in the optimal assignment
+        assigned_mask = np.zeros(self.sensitivity_matrix.shape, dtype=bool)
+        assigned_mask[row_ind, col_ind] = True
+
+        for (i, j), value in np.ndenumerate(self.sensitivity_matrix):
+            bg_color = 'lightgreen' if assigned_mask[i, j] else 'white'  # Assigned / unassigned cells
+
+            x = j * (cell_w + gap) + gap // 2
+            y = i * (cell_h + gap) + gap // 2
+            canvas.create_rectangle(x, y, x + cell_w, y + cell_h, fill=bg_color, outline='black')
+            canvas.create_text(x + cell_w / 2, y + cell_h / 2, text=f"{value:.2f}")
                 
     def create_visualization(self):
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-            
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-        
-        # Cost matrix heatmap
-        sns.heatmap(self.cost_matrix, annot=True, fmt='.1f', cmap='Blues', ax=ax1)
-        ax1.set_title('Cost Matrix')
-        
-        # Highlight optimal assignment with red rectangles
-        for i, j in zip(self.original_assignment[0], self.original_assignment[1]):
-            ax1.add_patch(plt.Rectangle((j, i), 1, 1, fill=False, edgecolor='red', lw=3))
-            
+        ax1, cbar_ax1, ax2, cbar_ax2 = self._viz_axes_for('single')
+
+        # The cost panel (and its assignment highlight) only depends on the
+        # cost matrix; re-analysing the same matrix with another method keeps
+        # its artists and only the sensitivity panel is re-plotted
+        if not np.array_equal(self._viz_drawn_cost, self.cost_matrix):
+            self._draw_cost_panel(ax1, cbar_ax1)
+            self._viz_drawn_cost = self.cost_matrix
+
+        # Plotting libraries are imported on first use to keep startup fast
+        import seaborn as sns
+
         # Sensitivity matrix heatmap
-        sns.heatmap(self.sensitivity_matrix, annot=True, fmt='.2f', cmap='Reds', ax=ax2)
+        ax2.clear()
+        cbar_ax2.clear()
+        # Labels formatted in one vectorized pass instead of per cell
+        labels = np.char.mod('%.2f', self.sensitivity_matrix)
+        sns.heatmap(self.sensitivity_matrix.astype(np.float32, copy=False), annot=labels, fmt='', cmap=self._colormap('Reds'), ax=ax2, cbar_ax=cbar_ax2)
         ax2.set_title(f'Sensitivity Matrix ({self.sensitivity_method.get()})')
         
-        canvas = FigureCanvasTkAgg(fig, self.viz_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._viz_canvas.draw_idle()
+
+    def _draw_cost_panel(self, ax1, cbar_ax1):
+        """Plot the cost matrix with the optimal assignment highlighted."""
+        from matplotlib.collections import PatchCollection
+
+        ax1.clear()
+        cbar_ax1.clear()
+
+        self._draw_matrix_image(ax1, cbar_ax1, self.cost_matrix, 'Blues', annot=self.cost_matrix.size <= 400)
+        ax1.set_title('Cost Matrix')
         
-        plt.tight_layout()
+        # Highlight optimal assignment with red rectangles (one collection)
+        ax1.add_collection(PatchCollection(self._assignment_rectangles(), facecolor='none',
+                                           edgecolor='red', linewidth=3))
         
+    def _draw_matrix_image(self, ax, cax, matrix, cmap, annot, fmt='.1f'):
+        """
+        Draw a matrix as a single image with its colorbar and optional
+        per-cell annotations.
+
+        The extent puts cell (i, j) at [j, j+1] x [i, i+1] like seaborn, so
+        the assignment rectangles line up with the cells.
+        """
+        rows, cols = matrix.shape
+        # float32 is ample for display and halves what the normalizer walks;
+        # labels are still formatted from the original values
+        im = ax.imshow(matrix.astype(np.float32, copy=False), cmap=self._colormap(cmap), aspect='auto', extent=(0, cols, rows, 0))
+        self._viz_fig.colorbar(im, cax=cax)
+        ax.set_xticks(np.arange(cols) + 0.5, labels=range(cols))
+        ax.set_yticks(np.arange(rows) + 0.5, labels=range(rows))
+
+        if annot:
+            labels = np.char.mod(f'%{fmt}', matrix)
+            shade = im.norm(matrix)
+            for (i, j), label in np.ndenumerate(labels):
+                ax.text(j + 0.5, i + 0.5, label, ha='center', va='center', fontsize=8,
+                        color='white' if shade[i, j] > 0.6 else 'black')
+        return im
+
     def create_comparison_visualization(self, methods):
         """
         Create side-by-side visualization of all sensitivity analysis methods.
@@ -683,32 +922,115 @@ class LSASensitivityAnalyzer:
         This allows users to compare how different mathematical approaches
         produce different sensitivity estimates for the same cost matrix.
         """
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
+        from matplotlib.collections import PatchCollection
+
+        axes = self._viz_axes_for('comparison')
+        heatmap_axes = axes[:, 0::2].flatten()
+        cbar_axes = axes[:, 1::2].flatten()
             
         n_methods = len(methods)
-        fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-        axes = axes.flatten()
-        
-        for idx, (method_name, sensitivity_matrix) in enumerate(methods.items()):
-            if idx < len(axes):
-                sns.heatmap(sensitivity_matrix, annot=True, fmt='.1f', 
-                           cmap='Reds', ax=axes[idx], cbar_kws={'shrink': 0.8})
-                axes[idx].set_title(f'{method_name} Method')
-                
-                # Highlight optimal assignment with blue rectangles
-                for i, j in zip(self.original_assignment[0], self.original_assignment[1]):
-                    axes[idx].add_patch(plt.Rectangle((j, i), 1, 1, fill=False, edgecolor='blue', lw=2))
-        
-        # Hide unused subplots
-        for idx in range(n_methods, len(axes)):
-            axes[idx].set_visible(False)
+        self._method_axes = {name: (ax, cax) for name, ax, cax in zip(methods, heatmap_axes, cbar_axes)}
+
+        # Per-cell text across six panels dominates drawing as the matrix
+        # grows, so only annotate small matrices
+        annot = self.cost_matrix.size <= 100
+
+        # Only re-plot panels whose data changed since the last draw; the
+        # highlight depends on the assignment, so it is part of the key
+        assignment_key = self.original_assignment[1].tobytes()
+        changed = False
+        for method_name, sensitivity_matrix in methods.items():
+            if method_name not in self._method_axes:
+                continue
+            key = hash((sensitivity_matrix.shape, sensitivity_matrix.tobytes(), assignment_key))
+            if self._method_hash.get(method_name) == key:
+                continue
+            ax, cax = self._method_axes[method_name]
+            ax.clear()
+            cax.clear()
+            # One image per panel rather than a seaborn mesh; the method
+            # scales differ too much to share one tiled image and colorbar
+            self._draw_matrix_image(ax, cax, sensitivity_matrix, 'Reds', annot)
+            ax.set_title(f'{method_name} Method')
             
-        canvas = FigureCanvasTkAgg(fig, self.viz_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-        
-        plt.tight_layout()
+            # Highlight optimal assignment with blue rectangles (one
+            # collection per axes; artists cannot be shared across axes)
+            ax.add_collection(PatchCollection(self._assignment_rectangles(), facecolor='none',
+                                              edgecolor='blue', linewidth=2))
+            self._method_hash[method_name] = key
+            changed = True
+        
+        # Remove unused subplots from the figure so constrained layout stops
+        # solving for them (only the first refresh of a figure has any)
+        for ax in (*heatmap_axes[n_methods:], *cbar_axes[n_methods:]):
+            if ax in self._viz_fig.axes:
+                self._viz_fig.delaxes(ax)
+            
+        if changed:
+            self._viz_canvas.draw_idle()
+
+    def _colormap(self, name):
+        """Colormap object for `name`, resolved from matplotlib's registry once."""
+        cmap = self._cmaps.get(name)
+        if cmap is None:
+            import matplotlib
+            cmap = self._cmaps[name] = matplotlib.colormaps[name]
+        return cmap
+
+    def _assignment_rectangles(self):
+        """Unit rectangles covering the optimal assignment's cells."""
+        from matplotlib.patches import Rectangle
+
+        return [Rectangle((j, i), 1, 1) for i, j in zip(*self.original_assignment)]
+
+    def _viz_axes_for(self, mode):
+        """
+        Return the axes for a visualization mode ('single' or 'comparison');
+        callers clear the axes they re-plot.
+
+        The Figure and its Tk canvas are cached and reused across analyses;
+        they are only destroyed and rebuilt when the number of subplots
+        changes, i.e. when switching between the two modes. Every heatmap
+        gets a dedicated colorbar axes, so clearing and re-plotting does not
+        keep stealing space for new colorbars.
+        """
+        if self._viz_mode != mode:
+            if self._viz_mode is None:
+                # First plot: pin the backend before seaborn pulls in pyplot,
+                # so pyplot never probes for one, and keep it non-interactive
+                # so nothing auto-draws while figures are being built
+                import matplotlib
+                matplotlib.use('TkAgg')
+                matplotlib.interactive(False)
+
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            # Release the previous figure's artists and Agg buffer before
+            # dropping the canvas, then collect the Tk/Figure reference cycles
+            if self._viz_fig is not None:
+                self._viz_fig.clear()
+                self._viz_fig = self._viz_axes = self._viz_canvas = None
+            for widget in self.viz_frame.winfo_children():
+                widget.destroy()
+            gc.collect()
+
+            # Figure built directly (not through pyplot, whose registry keeps
+            # figures alive) with constrained layout instead of tight_layout
+            if mode == 'single':
+                self._viz_fig = Figure(figsize=(12, 5), layout='constrained')
+                self._viz_axes = self._viz_fig.subplots(1, 4, gridspec_kw={'width_ratios': [20, 1, 20, 1]})
+            else:
+                self._viz_fig = Figure(figsize=(15, 10), layout='constrained')
+                self._viz_axes = self._viz_fig.subplots(2, 6, gridspec_kw={'width_ratios': [20, 1] * 3})
+
+            self._viz_canvas = FigureCanvasTkAgg(self._viz_fig, self.viz_frame)
+            self._viz_canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._viz_mode = mode
+            self._viz_drawn_cost = None
+            self._method_hash = {}
+
+        return self._viz_axes
 
 def main():
     root = tk.Tk()